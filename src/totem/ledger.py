@@ -2,9 +2,10 @@
 
 import json
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal
 
 from rich.console import Console
 
@@ -29,6 +30,33 @@ class LedgerWriter:
         """
         self.ledger_path = ledger_path
         self.run_id = run_id or str(uuid.uuid4())
+        self._batch_lines: list[str] | None = None
+
+    @contextmanager
+    def batch(self) -> Iterator["LedgerWriter"]:
+        """Buffer events and append them to disk in one write on exit.
+
+        Events created inside the block keep their original order and
+        timestamps; they hit the file as a single append instead of one
+        open/write per event. The flush also runs when the block raises,
+        so failure events are never lost. Nested batches join the
+        outermost one.
+        """
+        if self._batch_lines is not None:
+            # Already batching; the outer batch owns the flush.
+            yield self
+            return
+
+        self._batch_lines = []
+        try:
+            yield self
+        finally:
+            lines = self._batch_lines
+            self._batch_lines = None
+            if lines:
+                self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.ledger_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
 
     def append_event(
         self,
@@ -70,6 +98,7 @@ class LedgerWriter:
             "CHATGPT_EXPORT_PARSED",
             "CHATGPT_CONVERSATIONS_WRITTEN",
             "CHATGPT_DAILY_NOTE_WRITTEN",
+            "CHATGPT_DAILY_NOTE_UNCHANGED",
             "CHATGPT_METADATA_GENERATED",
             "CHATGPT_METADATA_SKIPPED",
             "CHATGPT_METADATA_FAILED",
@@ -95,9 +124,6 @@ class LedgerWriter:
         Returns:
             The created LedgerEvent
         """
-        # Ensure parent directory exists
-        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Create event
         event = LedgerEvent(
             event_id=str(uuid.uuid4()),
@@ -108,10 +134,19 @@ class LedgerWriter:
             payload=payload,
         )
 
+        # Use model_dump with mode='json' to ensure datetime serialization
+        json_str = json.dumps(event.model_dump(mode="json"))
+
+        if self._batch_lines is not None:
+            # Inside a batch() block: defer the disk append to the flush.
+            self._batch_lines.append(json_str + "\n")
+            return event
+
+        # Ensure parent directory exists
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Append to ledger (JSONL format: one JSON object per line)
         with open(self.ledger_path, "a", encoding="utf-8") as f:
-            # Use model_dump with mode='json' to ensure datetime serialization
-            json_str = json.dumps(event.model_dump(mode="json"))
             f.write(json_str + "\n")
 
         return event
@@ -53,6 +53,7 @@ class LedgerEvent(BaseModel):
         "CHATGPT_EXPORT_PARSED",
         "CHATGPT_CONVERSATIONS_WRITTEN",
         "CHATGPT_DAILY_NOTE_WRITTEN",
+        "CHATGPT_DAILY_NOTE_UNCHANGED",
         "CHATGPT_METADATA_GENERATED",
         "CHATGPT_METADATA_SKIPPED",
         "CHATGPT_METADATA_FAILED",
@@ -133,6 +133,45 @@ class TestConversationParser:
         finally:
             json_path.unlink()
 
+    def test_parse_conversations_stream_float_epochs(self):
+        """Test that the ZIP-stream path keeps float epoch timestamps."""
+        import zipfile
+
+        mock_data = [
+            {
+                "id": "conv_float",
+                "title": "Float Epochs",
+                "create_time": 1640995200.0,  # 2022-01-01
+                "update_time": 1640995260.0,
+                "mapping": {
+                    "node_1": {
+                        "message": {
+                            "author": {"role": "user"},
+                            "content": {"parts": ["Hello"]},
+                            "create_time": 1640995200.0,
+                        }
+                    },
+                },
+            }
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = Path(temp_dir) / "export.zip"
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                zf.writestr("conversations.json", json.dumps(mock_data))
+
+            with zipfile.ZipFile(zip_path) as zf:
+                with zf.open("conversations.json") as member:
+                    result = conversation_parser.parse_conversations_stream(member)
+
+        assert result.parsed_count == 1
+        conv = result.conversations[0]
+        # Epoch floats must parse, not fall back to "now"/None: the note
+        # directory layout and content hash both key off created_at
+        assert conv.created_at == datetime.fromtimestamp(1640995200.0)
+        assert conv.updated_at == datetime.fromtimestamp(1640995260.0)
+        assert conv.messages[0].created_at == datetime.fromtimestamp(1640995200.0)
+
     def test_parse_single_conversation_minimal(self):
         """Test parsing minimal conversation data."""
         conv_data = {
@@ -322,6 +361,177 @@ Some existing content.
             assert content.count("<!-- TOTEM:CHATGPT:START -->") == 1  # No duplicates
             assert "[[New Conversation]]" in content
 
+    def test_write_daily_note_unchanged_skips_write(self):
+        """Test that an idempotent re-run skips the write and logs UNCHANGED."""
+        conversations = [
+            models.ChatGptConversation(
+                conversation_id="conv_1",
+                title="Morning Chat",
+                created_at=datetime(2022, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
+                updated_at=datetime(2022, 1, 1, 9, 5, 0, tzinfo=timezone.utc),
+                messages=[]
+            )
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault_root = Path(temp_dir)
+
+            first_ledger = Mock()
+            daily_note.write_daily_note_chatgpt_block(
+                conversations,
+                "2022-01-01",
+                vault_root,
+                first_ledger,
+            )
+            assert (
+                first_ledger.append_event.call_args.kwargs["event_type"]
+                == "CHATGPT_DAILY_NOTE_WRITTEN"
+            )
+
+            daily_file = (
+                vault_root / "5.0 Journal" / "5.1 Daily" / "2022" / "01" / "2022-01-01.md"
+            )
+            stat_before = daily_file.stat()
+
+            second_ledger = Mock()
+            result = daily_note.write_daily_note_chatgpt_block(
+                conversations,
+                "2022-01-01",
+                vault_root,
+                second_ledger,
+            )
+
+            # Same block, so no rewrite: mtime is untouched and the ledger
+            # records the skip instead of a second WRITTEN event
+            assert result.block_replaced is False
+            assert result.marker_status == "existing"
+            assert daily_file.stat().st_mtime_ns == stat_before.st_mtime_ns
+            assert second_ledger.append_event.call_count == 1
+            assert (
+                second_ledger.append_event.call_args.kwargs["event_type"]
+                == "CHATGPT_DAILY_NOTE_UNCHANGED"
+            )
+
+    def test_write_daily_note_recovers_marker_debris(self):
+        """Test recovery when markers are orphaned, duplicated or misordered."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault_root = Path(temp_dir)
+            daily_dir = vault_root / "5.0 Journal" / "5.1 Daily" / "2022" / "01"
+            daily_dir.mkdir(parents=True, exist_ok=True)
+
+            # Orphaned end, a complete stale block, and an orphaned start
+            daily_file = daily_dir / "2022-01-01.md"
+            daily_file.write_text("""# 2022-01-01
+
+Notes before.
+
+<!-- TOTEM:CHATGPT:END -->
+
+<!-- TOTEM:CHATGPT:START -->
+- [[Stale Conversation]]
+<!-- TOTEM:CHATGPT:END -->
+
+Notes after.
+
+<!-- TOTEM:CHATGPT:START -->
+""")
+
+            conversations = [
+                models.ChatGptConversation(
+                    conversation_id="conv_1",
+                    title="Fresh Conversation",
+                    created_at=datetime(2022, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+                    updated_at=datetime(2022, 1, 1, 10, 5, 0, tzinfo=timezone.utc),
+                    messages=[]
+                )
+            ]
+
+            result = daily_note.write_daily_note_chatgpt_block(
+                conversations,
+                "2022-01-01",
+                vault_root,
+                Mock(),  # ledger_writer
+            )
+
+            assert result.marker_status == "recovered"
+            assert result.block_replaced is True
+
+            content = daily_file.read_text()
+            # Surrounding content survives; marker debris does not
+            assert "Notes before." in content
+            assert "Notes after." in content
+            assert "Stale Conversation" not in content
+            assert content.count("<!-- TOTEM:CHATGPT:START -->") == 1
+            assert content.count("<!-- TOTEM:CHATGPT:END -->") == 1
+            assert "[[Fresh Conversation]]" in content
+            assert content.index("<!-- TOTEM:CHATGPT:START -->") < content.index(
+                "<!-- TOTEM:CHATGPT:END -->"
+            )
+
+    def test_write_daily_note_large_note_mmap_path(self):
+        """Test block replacement and unchanged-skip on a note above the mmap threshold."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault_root = Path(temp_dir)
+            daily_dir = vault_root / "5.0 Journal" / "5.1 Daily" / "2022" / "01"
+            daily_dir.mkdir(parents=True, exist_ok=True)
+
+            # Pad the note past _MMAP_MIN_SIZE so the mmap splice runs
+            padding = "Lorem ipsum journal entry line.\n" * 4096
+            assert len(padding) >= daily_note._MMAP_MIN_SIZE
+            daily_file = daily_dir / "2022-01-01.md"
+            daily_file.write_text(f"""# 2022-01-01
+
+{padding}
+<!-- TOTEM:CHATGPT:START -->
+- [[Old Conversation]]
+<!-- TOTEM:CHATGPT:END -->
+
+Trailing notes.
+""")
+
+            conversations = [
+                models.ChatGptConversation(
+                    conversation_id="conv_1",
+                    title="New Conversation",
+                    created_at=datetime(2022, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+                    updated_at=datetime(2022, 1, 1, 10, 5, 0, tzinfo=timezone.utc),
+                    messages=[]
+                )
+            ]
+
+            result = daily_note.write_daily_note_chatgpt_block(
+                conversations,
+                "2022-01-01",
+                vault_root,
+                Mock(),  # ledger_writer
+            )
+
+            assert result.marker_status == "existing"
+            assert result.block_replaced is True
+
+            content = daily_file.read_text()
+            assert "Old Conversation" not in content
+            assert "[[New Conversation]]" in content
+            assert "Trailing notes." in content
+            assert content.count("<!-- TOTEM:CHATGPT:START -->") == 1
+
+            # Re-run takes the mmap unchanged path: no rewrite, UNCHANGED event
+            stat_before = daily_file.stat()
+            rerun_ledger = Mock()
+            rerun = daily_note.write_daily_note_chatgpt_block(
+                conversations,
+                "2022-01-01",
+                vault_root,
+                rerun_ledger,
+            )
+
+            assert rerun.block_replaced is False
+            assert daily_file.stat().st_mtime_ns == stat_before.st_mtime_ns
+            assert (
+                rerun_ledger.append_event.call_args.kwargs["event_type"]
+                == "CHATGPT_DAILY_NOTE_UNCHANGED"
+            )
+
 
 class TestLedgerEvent:
     """Test LedgerEvent validation with ChatGPT events."""
@@ -187,3 +187,51 @@ def test_ledger_timestamp_is_utc(vault_paths):
     from datetime import datetime
     parsed = datetime.fromisoformat(data["ts"].replace("Z", "+00:00"))
     assert parsed.tzinfo is not None, "Timestamp should include timezone info"
+
+
+def test_ledger_batch_defers_writes_until_exit(vault_paths):
+    """Test that batched events hit disk once, in order, on block exit."""
+    writer = LedgerWriter(vault_paths.ledger_file)
+
+    with writer.batch():
+        writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 1})
+        writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 2})
+
+        # Nothing on disk while the batch is open
+        assert read_ledger_tail(vault_paths.ledger_file, n=10) == []
+
+    events = read_ledger_tail(vault_paths.ledger_file, n=10)
+    assert [e.payload["index"] for e in events] == [1, 2]
+
+
+def test_ledger_batch_flushes_on_exception(vault_paths):
+    """Test that events buffered before a raise still reach the ledger."""
+    writer = LedgerWriter(vault_paths.ledger_file)
+
+    try:
+        with writer.batch():
+            writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 1})
+            raise RuntimeError("boom")
+    except RuntimeError:
+        # The failure handler appends its own event after the batch,
+        # exactly as ingest does
+        writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 2})
+
+    events = read_ledger_tail(vault_paths.ledger_file, n=10)
+    assert [e.payload["index"] for e in events] == [1, 2]
+
+
+def test_ledger_batch_nested_joins_outermost(vault_paths):
+    """Test that a nested batch defers its flush to the outer batch."""
+    writer = LedgerWriter(vault_paths.ledger_file)
+
+    with writer.batch():
+        writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 1})
+        with writer.batch():
+            writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 2})
+        # Inner block exited; still buffered until the outer one closes
+        assert read_ledger_tail(vault_paths.ledger_file, n=10) == []
+        writer.append_event(event_type="CAPTURE_INGESTED", payload={"index": 3})
+
+    events = read_ledger_tail(vault_paths.ledger_file, n=10)
+    assert [e.payload["index"] for e in events] == [1, 2, 3]